@@ -4,9 +4,13 @@ Run from project root:
     python benches/bench_python.py
 """
 
+import mmap
+import os
+import tempfile
 import time
 import statistics
 import sys
+from array import array
 
 # ── helpers ──────────────────────────────────────────────────────────
 
@@ -47,17 +51,47 @@ def bench_nucleation_set_blocks(n):
     for i in range(n):
         s.set_block(i, 0, 0, "minecraft:stone")
 
+def line_positions(n):
+    """Flat [x0,y0,z0, x1,y1,z1, ...] int32 buffer for set_blocks.
+
+    The binding reads buffer-protocol objects straight into its i32 span,
+    so an array('i') crosses the FFI without unboxing each int.
+    """
+    return array("i", (c for i in range(n) for c in (i, 0, 0)))
+
+def bench_nucleation_set_blocks_batch(positions):
+    import nucleation
+    s = nucleation.Schematic("bench")
+    s.set_blocks(positions, "minecraft:stone")
+
 def bench_nucleation_fill_cuboid(n):
     import nucleation
     s = nucleation.Schematic("bench")
     s.fill_cuboid(0, 0, 0, n - 1, n - 1, n - 1, "minecraft:stone")
 
-def bench_nucleation_fill_and_export(n):
+def build_nucleation_cube(n):
+    """Untimed setup: an n³ stone cube to export/transform."""
     import nucleation
     s = nucleation.Schematic("bench")
     s.fill_cuboid(0, 0, 0, n - 1, n - 1, n - 1, "minecraft:stone")
+    return s
+
+def bench_nucleation_export(s):
     _ = s.save_as("schematic")
 
+def bench_nucleation_flip_x(ref):
+    # Transforms mutate in place, so each run flips a fresh copy of the
+    # prebuilt cube instead of refilling it block by block.
+    s = ref.deep_clone()
+    s.flip_x()
+
+def bench_nucleation_load(path):
+    import nucleation
+    # Map the file instead of read()ing it: the binding takes any buffer for
+    # its byte span, so the page cache is parsed in place with no bytes copy.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return nucleation.Schematic.from_data(mm)
+
 # ── mcschematic benchmarks ──────────────────────────────────────────
 
 def mcschematic_available():
@@ -79,10 +113,15 @@ def bench_mcschematic_fill_cuboid(n):
     # cuboidFilled is on the internal MCStructure, not MCSchematic
     s.getStructure().cuboidFilled("minecraft:stone", (0, 0, 0), (n - 1, n - 1, n - 1))
 
-def bench_mcschematic_fill_and_export(n):
-    import mcschematic, tempfile, os
+def build_mcschematic_cube(n):
+    """Untimed setup: an n³ stone cube to export."""
+    import mcschematic
     s = mcschematic.MCSchematic()
     s.getStructure().cuboidFilled("minecraft:stone", (0, 0, 0), (n - 1, n - 1, n - 1))
+    return s
+
+def bench_mcschematic_export(s):
+    import mcschematic
     tmp = tempfile.mkdtemp()
     s.save(tmp, "bench", mcschematic.Version.JE_1_18_2)
     # clean up
@@ -109,7 +148,11 @@ if __name__ == "__main__":
     for n in [100, 1000, 10000]:
         print(f"\n── set_blocks  n={n} ──")
         if has_nuc:
+            # Built once, outside the timed closure: the batch row should
+            # measure the insert, not the Python-side buffer construction.
+            positions = line_positions(n)
             bench(lambda: bench_nucleation_set_blocks(n), f"nucleation  (n={n})")
+            bench(lambda: bench_nucleation_set_blocks_batch(positions), f"nucleation batch (n={n})")
         if has_mc:
             bench(lambda: bench_mcschematic_set_blocks(n), f"mcschematic (n={n})")
 
@@ -121,13 +164,36 @@ if __name__ == "__main__":
         if has_mc:
             bench(lambda: bench_mcschematic_fill_cuboid(n), f"mcschematic ({n}³)")
 
-    # --- fill + export ---
+    # --- export (cube built once, outside the timed region) ---
     for n in [10, 32]:
-        print(f"\n── fill_and_export  {n}x{n}x{n} ──")
+        print(f"\n── export  {n}x{n}x{n} ──")
         if has_nuc:
-            bench(lambda: bench_nucleation_fill_and_export(n), f"nucleation  ({n}³)")
+            nuc_ref = build_nucleation_cube(n)
+            bench(lambda: bench_nucleation_export(nuc_ref), f"nucleation  ({n}³)")
         if has_mc:
-            bench(lambda: bench_mcschematic_fill_and_export(n), f"mcschematic ({n}³)")
+            mcs_ref = build_mcschematic_cube(n)
+            bench(lambda: bench_mcschematic_export(mcs_ref), f"mcschematic ({n}³)")
+
+    # --- load (exported once, parsed from an mmap each run) ---
+    if has_nuc:
+        for n in [32, 64]:
+            print(f"\n── load  {n}x{n}x{n} ──")
+            fd, nuc_path = tempfile.mkstemp(suffix=".schem")
+            with os.fdopen(fd, "wb") as f:
+                f.write(build_nucleation_cube(n).save_as("schematic"))
+            try:
+                # from_data is a static constructor; make sure the row times a real parse.
+                assert bench_nucleation_load(nuc_path).block_count() > 0
+                bench(lambda: bench_nucleation_load(nuc_path), f"nucleation  ({n}³)")
+            finally:
+                os.remove(nuc_path)
+
+    # --- clone + flip_x (nucleation only; mcschematic has no transforms) ---
+    if has_nuc:
+        for n in [32, 64]:
+            print(f"\n── clone + flip_x  {n}x{n}x{n} ──")
+            nuc_ref = build_nucleation_cube(n)
+            bench(lambda: bench_nucleation_flip_x(nuc_ref), f"nucleation  ({n}³)")
 
     print("\n" + "=" * 72)
     print("Done.")
@@ -1,8 +1,9 @@
 use crate::bounding_box::BoundingBox;
 use crate::BlockState;
 use crate::UniversalSchematic;
+use rustc_hash::FxHashSet;
 use serde::{Deserialize, Serialize};
-use std::collections::{HashMap, HashSet, VecDeque};
+use std::collections::{HashMap, VecDeque};
 
 /// A DefinitionRegion represents a logical region defined by multiple bounding boxes.
 /// It is used for defining inputs, outputs, and other logical constructs that may be disjoint.
@@ -117,7 +118,7 @@ impl DefinitionRegion {
             return Self::new();
         }
 
-        let mut point_set: HashSet<(i32, i32, i32)> = positions.iter().cloned().collect();
+        let mut point_set: FxHashSet<(i32, i32, i32)> = positions.iter().cloned().collect();
         let mut boxes = Vec::new();
 
         // While there are points left to process
@@ -200,33 +201,137 @@ impl DefinitionRegion {
     // Boolean Operations (Mutating)
     // ========================================================================
 
+    /// Whether any two boxes share a position.
+    fn has_overlapping_boxes(&self) -> bool {
+        self.boxes
+            .iter()
+            .enumerate()
+            .any(|(i, a)| self.boxes[i + 1..].iter().any(|b| a.intersects(b)))
+    }
+
+    /// Decide whether a boolean op against `other` is cheaper box-against-box
+    /// than through a position set.
+    ///
+    /// Returns `None` for the position path, otherwise `Some((self_overlaps,
+    /// other_overlaps))`: which operands have overlapping boxes the box path
+    /// must normalise first. `other` is only scanned when `check_other` is set.
+    ///
+    /// The box path costs about `n * m` box checks, where `n` and `m` are the
+    /// box counts, plus `n^2 + m^2` for the overlap scans and for the pieces
+    /// `self` splits into as cuts accumulate. Any operand it has to normalise
+    /// adds its volume, since that goes through `from_positions`. The position
+    /// path costs one hash operation per covered position. Many-box operands,
+    /// such as the scattered single-block boxes `from_positions` produces for
+    /// `exclude_block`, therefore go through positions.
+    fn box_op_overlaps(&self, other: &DefinitionRegion, check_other: bool) -> Option<(bool, bool)> {
+        let (n, m) = (self.boxes.len() as u64, other.boxes.len() as u64);
+        let positions = self.volume().saturating_add(other.volume());
+        let mut box_cost = n.saturating_mul(m) + n.saturating_mul(n) + m.saturating_mul(m);
+        if box_cost > positions {
+            return None;
+        }
+
+        let self_overlaps = self.has_overlapping_boxes();
+        let other_overlaps = check_other && other.has_overlapping_boxes();
+        if self_overlaps {
+            box_cost = box_cost.saturating_add(self.volume());
+        }
+        if other_overlaps {
+            box_cost = box_cost.saturating_add(other.volume());
+        }
+        (box_cost <= positions).then_some((self_overlaps, other_overlaps))
+    }
+
     /// Subtract another region from this one (removes points present in `other`)
     ///
+    /// With few boxes on both sides, and disjoint ones in `self`, each box of
+    /// `self` is split around every overlapping box of `other`, costing
+    /// O(boxes(self) * boxes(other)) box checks. Otherwise the covered
+    /// positions are filtered through a hash set and re-merged with
+    /// `from_positions`, costing O(volume).
+    ///
+    /// The box path does not re-merge its output, so `boxes()` and
+    /// `box_count()` can come back more fragmented than the `from_positions`
+    /// result earlier versions returned, and repeated subtracts fragment
+    /// further. Call `simplify()` when a compact box list matters.
+    ///
     /// Mutates `self` in place. For an immutable version, use `subtracted()`.
     pub fn subtract(&mut self, other: &DefinitionRegion) -> &mut Self {
-        let other_positions: HashSet<_> = other.iter_positions().collect();
-        let remaining: Vec<_> = self
-            .iter_positions()
-            .filter(|pos| !other_positions.contains(pos))
-            .collect();
+        let Some((self_overlaps, _)) = self.box_op_overlaps(other, false) else {
+            let other_positions: FxHashSet<_> = other.iter_positions().collect();
+            let remaining: Vec<_> = self
+                .iter_positions()
+                .filter(|pos| !other_positions.contains(pos))
+                .collect();
+            self.boxes = Self::from_positions(&remaining).boxes;
+            return self;
+        };
+
+        // Overlapping input boxes would survive as overlapping pieces and be
+        // double-counted by `volume()`; normalise them first.
+        if self_overlaps {
+            self.simplify();
+        }
 
-        let simplified = Self::from_positions(&remaining);
-        self.boxes = simplified.boxes;
+        let mut pieces = Vec::with_capacity(self.boxes.len());
+        for cut in &other.boxes {
+            pieces.clear();
+            for bbox in &self.boxes {
+                if bbox.intersects(cut) {
+                    box_difference(bbox, cut, &mut pieces);
+                } else {
+                    pieces.push(bbox.clone());
+                }
+            }
+            std::mem::swap(&mut self.boxes, &mut pieces);
+        }
         self
     }
 
     /// Keep only points present in both regions (intersection)
     ///
+    /// With few, disjoint boxes on both sides the result is the pairwise
+    /// overlaps of the two regions' boxes, costing
+    /// O(boxes(self) * boxes(other)) box checks. Otherwise the covered
+    /// positions are filtered through a hash set and re-merged with
+    /// `from_positions`, costing O(volume).
+    ///
+    /// As with `subtract()`, the box path does not re-merge its output, so
+    /// `boxes()` and `box_count()` can be more fragmented than before; call
+    /// `simplify()` when a compact box list matters.
+    ///
     /// Mutates `self` in place. For an immutable version, use `intersected()`.
     pub fn intersect(&mut self, other: &DefinitionRegion) -> &mut Self {
-        let other_positions: HashSet<_> = other.iter_positions().collect();
-        let intersection: Vec<_> = self
-            .iter_positions()
-            .filter(|pos| other_positions.contains(pos))
+        let Some((self_overlaps, other_overlaps)) = self.box_op_overlaps(other, true) else {
+            let other_positions: FxHashSet<_> = other.iter_positions().collect();
+            let intersection: Vec<_> = self
+                .iter_positions()
+                .filter(|pos| other_positions.contains(pos))
+                .collect();
+            self.boxes = Self::from_positions(&intersection).boxes;
+            return self;
+        };
+
+        if self_overlaps {
+            self.simplify();
+        }
+        let simplified_other;
+        let other_boxes = if other_overlaps {
+            simplified_other = Self::from_positions(&other.iter_positions().collect::<Vec<_>>());
+            &simplified_other.boxes
+        } else {
+            &other.boxes
+        };
+
+        self.boxes = self
+            .boxes
+            .iter()
+            .flat_map(|a| {
+                other_boxes
+                    .iter()
+                    .filter_map(move |b| box_intersection(a, b))
+            })
             .collect();
-
-        let simplified = Self::from_positions(&intersection);
-        self.boxes = simplified.boxes;
         self
     }
 
@@ -332,14 +437,14 @@ impl DefinitionRegion {
     /// Check if all points in the region are connected (6-connectivity)
     /// Returns true if empty or all points form a single connected component
     pub fn is_contiguous(&self) -> bool {
-        let positions: HashSet<_> = self.iter_positions().collect();
+        let positions: FxHashSet<_> = self.iter_positions().collect();
         if positions.len() <= 1 {
             return true;
         }
 
         // BFS from any starting point
         let start = *positions.iter().next().unwrap();
-        let mut visited = HashSet::new();
+        let mut visited = FxHashSet::default();
         let mut queue = VecDeque::new();
 
         queue.push_back(start);
@@ -369,7 +474,7 @@ impl DefinitionRegion {
 
     /// Get the number of connected components in this region
     pub fn connected_components(&self) -> usize {
-        let positions: HashSet<_> = self.iter_positions().collect();
+        let positions: FxHashSet<_> = self.iter_positions().collect();
         if positions.is_empty() {
             return 0;
         }
@@ -656,6 +761,61 @@ impl DefinitionRegion {
     }
 }
 
+/// Overlap of two inclusive boxes, if any.
+fn box_intersection(a: &BoundingBox, b: &BoundingBox) -> Option<BoundingBox> {
+    if !a.intersects(b) {
+        return None;
+    }
+    Some(BoundingBox::new(
+        (
+            a.min.0.max(b.min.0),
+            a.min.1.max(b.min.1),
+            a.min.2.max(b.min.2),
+        ),
+        (
+            a.max.0.min(b.max.0),
+            a.max.1.min(b.max.1),
+            a.max.2.min(b.max.2),
+        ),
+    ))
+}
+
+/// Push the parts of `a` outside `cut` onto `out` as up to six disjoint boxes:
+/// the Y slabs below/above `cut`, then the X slabs within its Y span, then the
+/// Z slabs within its X and Y span. `a` and `cut` must intersect.
+fn box_difference(a: &BoundingBox, cut: &BoundingBox, out: &mut Vec<BoundingBox>) {
+    let (min, max) = (a.min, a.max);
+    let y0 = min.1.max(cut.min.1);
+    let y1 = max.1.min(cut.max.1);
+    let x0 = min.0.max(cut.min.0);
+    let x1 = max.0.min(cut.max.0);
+
+    if min.1 < cut.min.1 {
+        out.push(BoundingBox::new(min, (max.0, cut.min.1 - 1, max.2)));
+    }
+    if max.1 > cut.max.1 {
+        out.push(BoundingBox::new((min.0, cut.max.1 + 1, min.2), max));
+    }
+    if min.0 < cut.min.0 {
+        out.push(BoundingBox::new(
+            (min.0, y0, min.2),
+            (cut.min.0 - 1, y1, max.2),
+        ));
+    }
+    if max.0 > cut.max.0 {
+        out.push(BoundingBox::new(
+            (cut.max.0 + 1, y0, min.2),
+            (max.0, y1, max.2),
+        ));
+    }
+    if min.2 < cut.min.2 {
+        out.push(BoundingBox::new((x0, y0, min.2), (x1, y1, cut.min.2 - 1)));
+    }
+    if max.2 > cut.max.2 {
+        out.push(BoundingBox::new((x0, y0, cut.max.2 + 1), (x1, y1, max.2)));
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -687,6 +847,52 @@ mod tests {
         assert!(positions.contains(&(2, 0, 0)));
     }
 
+    #[test]
+    fn test_boolean_ops_match_point_sets() {
+        // Overlapping boxes on both sides exercise the normalisation path.
+        let mut a = DefinitionRegion::from_bounds((0, 0, 0), (4, 3, 4));
+        a.add_bounds((3, 2, 3), (6, 5, 6));
+        let mut b = DefinitionRegion::from_bounds((1, 1, 1), (2, 4, 2));
+        b.add_bounds((2, 0, 2), (5, 2, 7));
+
+        let a_set: FxHashSet<_> = a.iter_positions().collect();
+        let b_set: FxHashSet<_> = b.iter_positions().collect();
+
+        let diff = a.subtracted(&b);
+        let expected: FxHashSet<_> = a_set.difference(&b_set).cloned().collect();
+        assert_eq!(diff.iter_positions().collect::<FxHashSet<_>>(), expected);
+        assert_eq!(diff.volume(), expected.len() as u64);
+
+        let inter = a.intersected(&b);
+        let expected: FxHashSet<_> = a_set.intersection(&b_set).cloned().collect();
+        assert_eq!(inter.iter_positions().collect::<FxHashSet<_>>(), expected);
+        assert_eq!(inter.volume(), expected.len() as u64);
+    }
+
+    #[test]
+    fn test_boolean_ops_with_many_box_operand() {
+        // Scattered single-block boxes, like exclude_block's filter output.
+        let a = DefinitionRegion::from_bounds((0, 0, 0), (15, 15, 15));
+        let scattered: Vec<_> = a
+            .iter_positions()
+            .filter(|&(x, y, z)| (x * 7 + y * 13 + z * 5) % 11 == 0)
+            .collect();
+        let b = DefinitionRegion::from_positions(&scattered);
+        assert!(b.box_count() > 100);
+
+        let a_set: FxHashSet<_> = a.iter_positions().collect();
+        let b_set: FxHashSet<_> = b.iter_positions().collect();
+
+        let diff = a.subtracted(&b);
+        let expected: FxHashSet<_> = a_set.difference(&b_set).cloned().collect();
+        assert_eq!(diff.iter_positions().collect::<FxHashSet<_>>(), expected);
+        assert_eq!(diff.volume(), expected.len() as u64);
+
+        let inter = a.intersected(&b);
+        assert_eq!(inter.iter_positions().collect::<FxHashSet<_>>(), b_set);
+        assert_eq!(inter.volume(), b_set.len() as u64);
+    }
+
     #[test]
     fn test_shift() {
         let mut region = DefinitionRegion::from_bounds((0, 0, 0), (1, 1, 1));
@@ -9,6 +9,8 @@ Or from root: maturin develop --features simulation,python && python tests/pytho
 
 import sys
 import os
+import functools
+from array import array
 
 # Add the built module to path if running from development
 try:
@@ -44,8 +46,18 @@ except ImportError as e:
     sys.exit(1)
 
 
+# NUCLEATION_QUIET=1 drops pass lines and banners; failures still print.
+QUIET = os.environ.get("NUCLEATION_QUIET") == "1"
+
+
+def _say(text=""):
+    if not QUIET:
+        print(text)
+
+
 def _log_pass(name):
-    print(f"✅ {name}")
+    if not QUIET:
+        print(f"✅ {name}")
 
 
 def _log_fail(name, error):
@@ -436,20 +448,39 @@ def test_definition_region_copy():
 # =============================================================================
 
 
+# lever -> 4 wires -> lamp, shared by every simulation test below.
+_BASE_SCHEMATIC_BLOCKS = [
+    ((0, 0, 0), "minecraft:gray_concrete"),
+    ((0, 1, 0), "minecraft:lever[facing=east,powered=false,face=floor]"),
+    ((1, 1, 0), "minecraft:redstone_wire[power=0]"),
+    ((2, 1, 0), "minecraft:redstone_wire[power=0]"),
+    ((3, 1, 0), "minecraft:redstone_wire[power=0]"),
+    ((4, 1, 0), "minecraft:redstone_wire[power=0]"),
+    ((5, 1, 0), "minecraft:redstone_lamp[lit=false]"),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _lever_lamp_template():
+    """Build the shared lever/lamp schematic once; tests take a `deep_clone()`."""
+    by_block = {}
+    for pos, block in _BASE_SCHEMATIC_BLOCKS:
+        by_block.setdefault(block, array("i")).extend(pos)
+    schematic = Schematic("Sim Test")
+    # One set_blocks call per distinct state: the four wires parse once, and
+    # array("i") hands Rust the coordinates as a buffer with no list copy.
+    for block, positions in by_block.items():
+        schematic.set_blocks(positions, block)
+    return schematic
+
+
 def test_simulation_basic():
     """Test basic simulation functionality."""
     if not SIMULATION_AVAILABLE:
         print("⏭️ Skipping simulation tests (feature not enabled)")
         return
 
-    schematic = Schematic("Sim Test")
-    schematic.set_block(0, 0, 0, "minecraft:gray_concrete")
-    schematic.set_block(
-        0, 1, 0, "minecraft:lever[facing=east,powered=false,face=floor]"
-    )
-    for x in range(1, 5):
-        schematic.set_block(x, 1, 0, "minecraft:redstone_wire[power=0]")
-    schematic.set_block(5, 1, 0, "minecraft:redstone_lamp[lit=false]")
+    schematic = _lever_lamp_template().deep_clone()
 
     world = schematic.create_simulation_world()
 
@@ -471,14 +502,7 @@ def test_typed_executor():
     if not SIMULATION_AVAILABLE:
         return
 
-    schematic = Schematic("Executor Test")
-    schematic.set_block(0, 0, 0, "minecraft:gray_concrete")
-    schematic.set_block(
-        0, 1, 0, "minecraft:lever[facing=east,powered=false,face=floor]"
-    )
-    for x in range(1, 5):
-        schematic.set_block(x, 1, 0, "minecraft:redstone_wire[power=0]")
-    schematic.set_block(5, 1, 0, "minecraft:redstone_lamp[lit=false]")
+    schematic = _lever_lamp_template().deep_clone()
 
     # Build layout
     world = schematic.create_simulation_world()
@@ -490,7 +514,9 @@ def test_typed_executor():
     executor = TypedCircuitExecutor.from_layout(world, layout)
 
     # Execute
-    result = executor.execute({"in": True}, ExecutionMode.fixed_ticks(100))
+    result = executor.execute(
+        {"in": True}, ExecutionMode.until_stable(stable_ticks=2, max_ticks=100)
+    )
 
     assert "outputs" in result
     assert "out" in result["outputs"]
@@ -503,14 +529,7 @@ def test_manual_tick_control():
     if not SIMULATION_AVAILABLE:
         return
 
-    schematic = Schematic("Manual Tick Test")
-    schematic.set_block(0, 0, 0, "minecraft:gray_concrete")
-    schematic.set_block(
-        0, 1, 0, "minecraft:lever[facing=east,powered=false,face=floor]"
-    )
-    for x in range(1, 5):
-        schematic.set_block(x, 1, 0, "minecraft:redstone_wire[power=0]")
-    schematic.set_block(5, 1, 0, "minecraft:redstone_lamp[lit=false]")
+    schematic = _lever_lamp_template().deep_clone()
 
     world = schematic.create_simulation_world()
     builder = IoLayoutBuilder()
@@ -541,14 +560,7 @@ def test_circuit_builder():
     if not SIMULATION_AVAILABLE:
         return
 
-    schematic = Schematic("Builder Test")
-    schematic.set_block(0, 0, 0, "minecraft:gray_concrete")
-    schematic.set_block(
-        0, 1, 0, "minecraft:lever[facing=east,powered=false,face=floor]"
-    )
-    for x in range(1, 5):
-        schematic.set_block(x, 1, 0, "minecraft:redstone_wire[power=0]")
-    schematic.set_block(5, 1, 0, "minecraft:redstone_lamp[lit=false]")
+    schematic = _lever_lamp_template().deep_clone()
 
     input_region = DefinitionRegion()
     input_region.add_point(0, 1, 0)
@@ -566,7 +578,9 @@ def test_circuit_builder():
     assert "out" in builder.output_names()
 
     executor = builder.build()
-    result = executor.execute({"in": True}, ExecutionMode.fixed_ticks(100))
+    result = executor.execute(
+        {"in": True}, ExecutionMode.until_stable(stable_ticks=2, max_ticks=100)
+    )
 
     assert result["outputs"]["out"] == True
 
@@ -578,14 +592,7 @@ def test_io_layout_builder_regions():
     if not SIMULATION_AVAILABLE:
         return
 
-    schematic = Schematic("Region Test")
-    schematic.set_block(0, 0, 0, "minecraft:gray_concrete")
-    schematic.set_block(
-        0, 1, 0, "minecraft:lever[facing=east,powered=false,face=floor]"
-    )
-    for x in range(1, 5):
-        schematic.set_block(x, 1, 0, "minecraft:redstone_wire[power=0]")
-    schematic.set_block(5, 1, 0, "minecraft:redstone_lamp[lit=false]")
+    schematic = _lever_lamp_template().deep_clone()
 
     region = DefinitionRegion()
     region.add_point(0, 1, 0)
@@ -605,14 +612,7 @@ def test_get_layout_info():
     if not SIMULATION_AVAILABLE:
         return
 
-    schematic = Schematic("Layout Info Test")
-    schematic.set_block(0, 0, 0, "minecraft:gray_concrete")
-    schematic.set_block(
-        0, 1, 0, "minecraft:lever[facing=east,powered=false,face=floor]"
-    )
-    for x in range(1, 5):
-        schematic.set_block(x, 1, 0, "minecraft:redstone_wire[power=0]")
-    schematic.set_block(5, 1, 0, "minecraft:redstone_lamp[lit=false]")
+    schematic = _lever_lamp_template().deep_clone()
 
     world = schematic.create_simulation_world()
     builder = IoLayoutBuilder()
@@ -763,20 +763,20 @@ def test_circuit_builder_with_sort_strategy():
 
 
 def run_all_tests():
-    print("=" * 60)
-    print("Running Nucleation Python Tests")
-    print("=" * 60)
-    print()
+    _say("=" * 60)
+    _say("Running Nucleation Python Tests")
+    _say("=" * 60)
+    _say()
 
     # Core tests
-    print("--- Core Schematic Tests ---")
+    _say("--- Core Schematic Tests ---")
     test_schematic_creation()
     test_block_operations()
     test_dimensions()
-    print()
+    _say()
 
     # DefinitionRegion tests
-    print("--- DefinitionRegion Tests ---")
+    _say("--- DefinitionRegion Tests ---")
     test_definition_region_creation()
     test_definition_region_from_bounds()
     test_definition_region_boolean_operations()
@@ -784,10 +784,10 @@ def run_all_tests():
     test_definition_region_connectivity()
     test_definition_region_positions()
     test_definition_region_contains()
-    print()
+    _say()
 
     # DefinitionRegion Renderer Support tests (NEW)
-    print("--- DefinitionRegion Renderer Support Tests ---")
+    _say("--- DefinitionRegion Renderer Support Tests ---")
     test_definition_region_from_bounding_boxes()
     test_definition_region_from_positions()
     test_definition_region_box_access()
@@ -797,28 +797,28 @@ def run_all_tests():
     test_definition_region_intersects_bounds()
     test_definition_region_immutable_transforms()
     test_definition_region_copy()
-    print()
+    _say()
 
     # Simulation tests
-    print("--- Simulation Tests ---")
+    _say("--- Simulation Tests ---")
     test_simulation_basic()
     test_typed_executor()
     test_manual_tick_control()
     test_circuit_builder()
     test_io_layout_builder_regions()
     test_get_layout_info()
-    print()
+    _say()
 
     # SortStrategy tests (NEW)
-    print("--- SortStrategy Tests ---")
+    _say("--- SortStrategy Tests ---")
     test_sort_strategy_creation()
     test_sort_strategy_from_string()
     test_circuit_builder_with_sort_strategy()
-    print()
+    _say()
 
-    print("=" * 60)
-    print("All tests completed!")
-    print("=" * 60)
+    _say("=" * 60)
+    _say("All tests completed!")
+    _say("=" * 60)
 
 
 if __name__ == "__main__":
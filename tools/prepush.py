@@ -2,14 +2,28 @@
 """Pre-push verification for the generated-bindings world.
 
 Runs the same gates CI does: core tests, bindings freshness/determinism,
-bridge coverage, and the local smoke tests. Fast-fails on the first error.
+bridge coverage, and the local smoke tests. Fast-fails on the first failing
+gate; the smoke tests then run in parallel and all report before exiting.
 """
 
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
+# Keys of checks that passed against the current tree; see tree_key().
+CACHE_FILE = ROOT / "target" / "prepush-cache.json"
+# How long a smoke check gets to exit after SIGTERM before it is SIGKILLed.
+KILL_GRACE_SECONDS = 5
 
 CHECKS: list[tuple[str, list[str]]] = [
     ("cargo test", ["cargo", "test"]),
@@ -32,6 +46,12 @@ CHECKS: list[tuple[str, list[str]]] = [
             "--no-deps --format-version 1 >/dev/null",
         ],
     ),
+]
+
+# The smoke scripts only share the bridge build (which cargo's target-dir lock
+# serialises and then finds fresh); their compile-and-run halves are
+# independent, so they run side by side once the gates above have passed.
+SMOKE_CHECKS: list[tuple[str, list[str]]] = [
     ("smoke: C", ["./examples/bridge_smoke/c/run.sh"]),
     ("smoke: C++", ["./examples/bridge_smoke/cpp/run.sh"]),
     ("smoke: PHP", ["./examples/bridge_smoke/php/run.sh"]),
@@ -40,13 +60,188 @@ CHECKS: list[tuple[str, list[str]]] = [
 ]
 
 
+def check_env() -> dict[str, str]:
+    """Environment for every check: route rustc through sccache when it's installed.
+
+    The checks (and the smoke scripts under them) build the crate with several
+    feature sets; cargo keeps those apart in one target dir, but sccache also
+    lets them share the compiled dependency graph and survive `cargo clean`.
+    An explicit RUSTC_WRAPPER from the caller always wins.
+    """
+    env = dict(os.environ)
+    if "RUSTC_WRAPPER" not in env and shutil.which("sccache"):
+        env["RUSTC_WRAPPER"] = "sccache"
+    return env
+
+
+def tree_key() -> str | None:
+    """Fingerprint of what the checks see: HEAD's tree plus uncommitted tracked changes.
+
+    Untracked files are left out: they are not part of the push, and the smoke
+    scripts and sdist staging leave untracked output behind on every run.
+    Returns None (caching off) when git can't answer.
+    """
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD^{tree}"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+        ).stdout
+        diff = subprocess.run(
+            ["git", "diff", "HEAD", "--binary", "--no-ext-diff", "--no-textconv"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return hashlib.sha256(head + b"\0" + diff).hexdigest()
+
+
+def check_key(tree: str, cmd: list[str]) -> str:
+    return hashlib.sha256("\0".join([tree, *cmd]).encode()).hexdigest()
+
+
+def load_cache() -> set[str]:
+    try:
+        return set(json.loads(CACHE_FILE.read_text()))
+    except (OSError, ValueError, TypeError):
+        return set()
+
+
+def save_cache(passed: set[str]) -> None:
+    # Write-then-rename: an interrupted run must never leave a torn cache.
+    tmp = CACHE_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(sorted(passed)) + "\n")
+    os.replace(tmp, CACHE_FILE)
+
+
+def _exit_on_signal(signum: int, frame: object) -> None:
+    raise SystemExit(128 + signum)
+
+
+def run_parallel(
+    checks: list[tuple[str, list[str]]],
+    env: dict[str, str],
+    on_pass: Callable[[list[str]], None],
+) -> int:
+    """Run independent checks concurrently, replaying each one's output in list order.
+
+    Calls `on_pass(cmd)` for each check that succeeds. Returns the exit code
+    of the first failing check, or 0.
+
+    Each check runs in its own session, so signals aimed at this script's
+    process group (Ctrl-C, a closed terminal, a killed `git push`) reach only
+    this script. SIGTERM and SIGHUP are turned into SystemExit for the
+    duration, so every exit path runs the teardown below, which kills each
+    still-running check's whole process group (cargo, rustc, linkers, node)
+    rather than orphaning it: SIGTERM first, then SIGKILL for any group that
+    has not exited within KILL_GRACE_SECONDS.
+    """
+    print("==> " + ", ".join(name for name, _ in checks) + " (in parallel)")
+    failed = 0
+    exit_signals = [
+        getattr(signal, name) for name in ("SIGTERM", "SIGHUP") if hasattr(signal, name)
+    ]
+    previous = {sig: signal.signal(sig, _exit_on_signal) for sig in exit_signals}
+    with tempfile.TemporaryDirectory() as tmp:
+        running = []
+        try:
+            for i, (name, cmd) in enumerate(checks):
+                log = open(Path(tmp) / f"{i}.log", "w+b")
+                try:
+                    proc = subprocess.Popen(
+                        cmd,
+                        cwd=ROOT,
+                        env=env,
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                        start_new_session=True,
+                    )
+                except OSError as e:
+                    # Not started (missing interpreter, no exec bit): report it
+                    # like any other failed check and keep launching the rest.
+                    log.close()
+                    print(f"==> {name}", flush=True)
+                    print(e, file=sys.stderr)
+                    print(f"FAILED: {name}", file=sys.stderr)
+                    failed = failed or 1
+                    continue
+                running.append((name, cmd, log, proc))
+            for name, cmd, log, proc in running:
+                returncode = proc.wait()
+                print(f"==> {name}", flush=True)
+                log.seek(0)
+                shutil.copyfileobj(log, sys.stdout.buffer)
+                sys.stdout.flush()
+                if returncode != 0:
+                    print(f"FAILED: {name}", file=sys.stderr)
+                    failed = failed or returncode
+                else:
+                    on_pass(cmd)
+        finally:
+            for _, _, log, proc in running:
+                if proc.poll() is None:
+                    # With start_new_session the child leads its own group.
+                    # SIGKILL if it ignores SIGTERM, so prepush itself never hangs.
+                    try:
+                        os.killpg(proc.pid, signal.SIGTERM)
+                        proc.wait(timeout=KILL_GRACE_SECONDS)
+                    except ProcessLookupError:
+                        pass
+                    except subprocess.TimeoutExpired:
+                        try:
+                            os.killpg(proc.pid, signal.SIGKILL)
+                        except ProcessLookupError:
+                            pass
+                    proc.wait()
+                log.close()
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+    return failed
+
+
 def main() -> int:
+    env = check_env()
+    # A check that already passed on this exact tree is skipped, so re-running
+    # after a fixup (or pushing the same tree twice) only redoes what failed.
+    # --no-cache forces everything, e.g. after a toolchain upgrade.
+    tree = None if "--no-cache" in sys.argv[1:] else tree_key()
+    cached = load_cache() if tree else set()
+    if tree:
+        # Once up front, not on every save_cache() after each passing check.
+        CACHE_FILE.parent.mkdir(exist_ok=True)
+    passed: set[str] = set()
+
+    def record(cmd: list[str]) -> None:
+        if tree:
+            passed.add(check_key(tree, cmd))
+            save_cache(passed)
+
     for name, cmd in CHECKS:
+        if tree and check_key(tree, cmd) in cached:
+            print(f"==> {name} (cached pass)")
+            record(cmd)
+            continue
         print(f"==> {name}")
-        proc = subprocess.run(cmd, cwd=ROOT)
+        proc = subprocess.run(cmd, cwd=ROOT, env=env)
         if proc.returncode != 0:
             print(f"FAILED: {name}", file=sys.stderr)
             return proc.returncode
+        record(cmd)
+
+    smoke = []
+    for name, cmd in SMOKE_CHECKS:
+        if tree and check_key(tree, cmd) in cached:
+            print(f"==> {name} (cached pass)")
+            record(cmd)
+        else:
+            smoke.append((name, cmd))
+    if smoke:
+        returncode = run_parallel(smoke, env, record)
+        if returncode != 0:
+            return returncode
     print("all pre-push checks passed")
     return 0
 